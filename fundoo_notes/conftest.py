@@ -0,0 +1,37 @@
+import os
+
+import pytest
+
+
+def pytest_configure():
+    """Swap PBKDF2 for MD5 under tests.
+
+    Password hashing dominates user-fixture setup time (hundreds of
+    thousands of PBKDF2 iterations per create_user/login); MD5 is
+    effectively free and security is irrelevant for throwaway test
+    users.
+    """
+    from django.conf import settings
+
+    settings.PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+    # Each xdist worker gets its own Postgres database but they all
+    # share one Redis, and the first user in every worker DB gets id 1,
+    # so cache keys like user_1:notes would collide across workers.
+    # Point each worker at its own Redis logical database instead.
+    worker = os.environ.get('PYTEST_XDIST_WORKER', 'gw0')
+    db = 2 + int(worker[2:] or 0) % 14
+    location = settings.CACHES['default']['LOCATION']
+    settings.CACHES['default']['LOCATION'] = f"{location.rsplit('/', 1)[0]}/{db}"
+
+
+@pytest.fixture(autouse=True)
+def _flush_note_cache():
+    """DB writes roll back at the end of each test but Redis writes
+    persist, so a rolled-back note would otherwise linger in the note
+    hash and bucket sets; flush this worker's cache database after
+    each test."""
+    yield
+    from django_redis import get_redis_connection
+
+    get_redis_connection('default').flushdb()
@@ -0,0 +1,38 @@
+"""
+URL configuration for fundoo_notes project.
+"""
+from django.conf import settings
+from django.contrib import admin
+from django.urls import include, path
+
+urlpatterns = [
+    path('admin/', admin.site.urls),
+    path('api/user/', include('user.urls')),
+    path('api/labels/', include('labels.urls')),
+    path('api/notes/', include('notes.urls')),
+]
+
+if settings.DEBUG:
+    # Only development workers pay the drf_yasg import and schema build;
+    # production processes never load the package at all.
+    from drf_yasg import openapi
+    from drf_yasg.views import get_schema_view
+    from rest_framework import permissions
+
+    schema_view = get_schema_view(
+        openapi.Info(
+            title="Fundoo Notes API",
+            default_version='v1',
+            description="API documentation for the Fundoo Notes project",
+        ),
+        public=True,
+        permission_classes=(permissions.AllowAny,),
+    )
+
+    urlpatterns.append(
+        path(
+            'swagger/',
+            schema_view.with_ui('swagger', cache_timeout=0),
+            name='schema-swagger-ui',
+        )
+    )
@@ -0,0 +1,36 @@
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import DatabaseError
+from loguru import logger
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import exception_handler
+
+
+def fundoo_exception_handler(exc, context):
+    """Map exceptions to the project's error envelope in one place.
+
+    Views keep only their happy path; anything raised lands here instead
+    of per-view try/except ladders. DRF's own handler deals with its
+    APIException family first (ValidationError -> 400, auth errors ->
+    401/403), then ORM-level exceptions are translated below.
+    """
+    response = exception_handler(exc, context)
+    if response is not None:
+        response.data = {
+            "message": "Request failed.",
+            "status": "error",
+            "error": response.data,
+        }
+        return response
+    if isinstance(exc, ObjectDoesNotExist):
+        return Response(
+            {"message": "Not found.", "status": "error", "error": str(exc)},
+            status=status.HTTP_404_NOT_FOUND,
+        )
+    if isinstance(exc, DatabaseError):
+        logger.opt(lazy=True).error("Database error: {}", lambda: str(exc))
+        return Response(
+            {"message": "Database error.", "status": "error", "error": str(exc)},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+    return None
@@ -0,0 +1,11 @@
+"""
+WSGI config for fundoo_notes project.
+"""
+
+import os
+
+from django.core.wsgi import get_wsgi_application
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'fundoo_notes.settings')
+
+application = get_wsgi_application()
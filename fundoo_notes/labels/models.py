@@ -0,0 +1,19 @@
+from django.conf import settings
+from django.db import models
+
+
+class Label(models.Model):
+    name = models.CharField(max_length=255)
+    color = models.CharField(max_length=255, null=True, blank=True)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='labels'
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user']),
+            models.Index(fields=['user', 'id']),
+        ]
+
+    def __str__(self):
+        return self.name
@@ -0,0 +1,39 @@
+from rest_framework import serializers
+
+from .models import Label
+
+
+class LabelListSerializer(serializers.ListSerializer):
+    """Writes a whole batch of labels with one multi-row INSERT."""
+
+    def create(self, validated_data):
+        return Label.objects.bulk_create(
+            [Label(**item) for item in validated_data], batch_size=500
+        )
+
+
+class LabelSerializer(serializers.Serializer):
+    """Hand-written serializer for the label hot path.
+
+    Declaring the fields explicitly skips ModelSerializer's per-request
+    model introspection and validator construction.
+    """
+
+    id = serializers.IntegerField(read_only=True)
+    name = serializers.CharField(max_length=255)
+    color = serializers.CharField(
+        max_length=255, allow_null=True, required=False, default=None
+    )
+    user = serializers.PrimaryKeyRelatedField(read_only=True)
+
+    class Meta:
+        list_serializer_class = LabelListSerializer
+
+    def create(self, validated_data):
+        return Label.objects.create(**validated_data)
+
+    def update(self, instance, validated_data):
+        for field, value in validated_data.items():
+            setattr(instance, field, value)
+        instance.save(update_fields=list(validated_data))
+        return instance
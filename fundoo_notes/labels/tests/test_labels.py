@@ -0,0 +1,138 @@
+import json
+
+import pytest
+from django.urls import reverse_lazy
+
+# Resolve URLs once at import instead of walking the resolver per test.
+LIST_URL = reverse_lazy('label-list-create')
+REGISTER_URL = reverse_lazy('register')
+LOGIN_URL = reverse_lazy('login')
+
+
+def detail_url(label_id):
+    return f"{LIST_URL}{label_id}/"
+
+
+@pytest.fixture(scope='session')
+def create_user(django_db_setup, django_db_blocker):
+    """Session-cached ORM user, created once and reused by every class
+    (and surviving --reuse-db runs); a second /register round-trip for
+    the same committed email would 400."""
+    from user.models import CustomUser
+
+    user_data = {
+        "username": "testuser",
+        "email": "testuser@gmail.com",
+        "password": "Password@123",
+    }
+    with django_db_blocker.unblock():
+        user = CustomUser.objects.filter(email=user_data["email"]).first()
+        if user is None:
+            user = CustomUser.objects.create_user(**user_data)
+    user_data["id"] = user.id
+    return user_data
+
+
+@pytest.fixture(scope='session')
+def generate_usertoken(create_user, django_db_blocker):
+    from django.test import Client
+
+    with django_db_blocker.unblock():
+        response = Client().post(
+            LOGIN_URL,
+            data=json.dumps(
+                {"email": create_user["email"], "password": create_user["password"]}
+            ),
+            content_type='application/json',
+        )
+    assert response.status_code == 200
+    return response.data["data"]["access"]
+
+
+@pytest.fixture
+def create_label(client, generate_usertoken):
+    response = client.post(
+        LIST_URL,
+        data=json.dumps({"name": "Test Label", "color": "red"}),
+        content_type='application/json',
+        HTTP_AUTHORIZATION=f'Bearer {generate_usertoken}',
+    )
+    assert response.status_code == 201
+    return response.data["data"]["id"]
+
+
+@pytest.mark.django_db
+class TestLabelSuccess:
+
+    def test_label_create(self, client, generate_usertoken):
+        data = {"name": "Work", "color": "blue"}
+        response = client.post(
+            LIST_URL,
+            data=json.dumps(data),
+            content_type='application/json',
+            HTTP_AUTHORIZATION=f'Bearer {generate_usertoken}',
+        )
+        assert response.status_code == 201
+        assert response.data["data"]["name"] == "Work"
+
+    def test_label_list(self, client, generate_usertoken, create_label):
+        response = client.get(
+            LIST_URL, HTTP_AUTHORIZATION=f'Bearer {generate_usertoken}'
+        )
+        assert response.status_code == 200
+        assert len(response.data["data"]) == 1
+
+    def test_label_update(self, client, generate_usertoken, create_label):
+        response = client.put(
+            detail_url(create_label),
+            data=json.dumps({"name": "Updated", "color": "green"}),
+            content_type='application/json',
+            HTTP_AUTHORIZATION=f'Bearer {generate_usertoken}',
+        )
+        assert response.status_code == 200
+        assert response.data["data"]["name"] == "Updated"
+
+    def test_label_delete(self, client, generate_usertoken, create_label):
+        response = client.delete(
+            detail_url(create_label),
+            HTTP_AUTHORIZATION=f'Bearer {generate_usertoken}',
+        )
+        assert response.status_code == 204
+
+
+@pytest.mark.django_db
+class TestLabelFailure:
+
+    def test_label_create_invalid_token(self, client):
+        response = client.post(
+            LIST_URL,
+            data=json.dumps({"name": "Work"}),
+            content_type='application/json',
+            HTTP_AUTHORIZATION='Bearer invalid-token',
+        )
+        assert response.status_code == 401
+
+    def test_label_create_missing_name(self, client, generate_usertoken):
+        response = client.post(
+            LIST_URL,
+            data=json.dumps({"color": "blue"}),
+            content_type='application/json',
+            HTTP_AUTHORIZATION=f'Bearer {generate_usertoken}',
+        )
+        assert response.status_code == 400
+
+    def test_label_update_invalid_id(self, client, generate_usertoken):
+        response = client.put(
+            detail_url(999),
+            data=json.dumps({"name": "Updated"}),
+            content_type='application/json',
+            HTTP_AUTHORIZATION=f'Bearer {generate_usertoken}',
+        )
+        assert response.status_code == 404
+
+    def test_label_delete_invalid_id(self, client, generate_usertoken):
+        response = client.delete(
+            detail_url(999),
+            HTTP_AUTHORIZATION=f'Bearer {generate_usertoken}',
+        )
+        assert response.status_code == 404
@@ -0,0 +1,12 @@
+from django.urls import path
+
+from .views import (LabelBulkCreateView, LabelViewSet, LabelViewSetByID,
+                    RawSQLLabelView, RawSQLLabelViewByID)
+
+urlpatterns = [
+    path('', LabelViewSet.as_view(), name='label-list-create'),
+    path('bulk/', LabelBulkCreateView.as_view(), name='label-bulk-create'),
+    path('<int:pk>/', LabelViewSetByID.as_view(), name='label-detail'),
+    path('raw/', RawSQLLabelView.as_view(), name='label-raw-list-create'),
+    path('raw/<int:pk>/', RawSQLLabelViewByID.as_view(), name='label-raw-detail'),
+]
@@ -0,0 +1,408 @@
+import orjson
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.http import HttpResponse
+from loguru import logger
+from rest_framework import status
+from rest_framework.generics import GenericAPIView
+from rest_framework.mixins import (CreateModelMixin, DestroyModelMixin,
+                                   ListModelMixin, UpdateModelMixin)
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from user.authentication import CachedJWTAuthentication
+
+from .models import Label
+from .serializer import LabelSerializer
+
+LABEL_CACHE_TIMEOUT = 300
+
+# Shared singleton for drf-yasg schema generation; QuerySets are lazy and
+# never evaluated for fake views, so one instance is safe to reuse.
+_EMPTY = Label.objects.none()
+
+
+def swagger(schema_factory):
+    """Apply drf_yasg schema annotations only while DEBUG is on.
+
+    The factory defers both the drf_yasg import and the openapi schema
+    construction, so production workers never load or build either.
+    """
+    if settings.DEBUG:
+        from drf_yasg.utils import swagger_auto_schema
+        return swagger_auto_schema(**schema_factory())
+    return lambda view: view
+
+
+def _label_body_schema():
+    from drf_yasg import openapi
+
+    return {
+        'request_body': openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            required=['name'],
+            properties={
+                'name': openapi.Schema(type=openapi.TYPE_STRING),
+                'color': openapi.Schema(type=openapi.TYPE_STRING),
+            },
+        )
+    }
+
+
+class LabelPagination(PageNumberPagination):
+    page_size = 100
+
+
+def _labels_cache_key(user_id):
+    """Versioned per-user cache key; bumping the version invalidates."""
+    version = cache.get(f"labels_ver:{user_id}", 0)
+    return f"labels:v{version}:u{user_id}"
+
+
+def _bump_labels_version(user_id):
+    """Invalidate the user's cached label list by moving to a new key."""
+    if not cache.add(f"labels_ver:{user_id}", 1):
+        cache.incr(f"labels_ver:{user_id}")
+
+
+# Error handling lives in fundoo_notes.utils.fundoo_exception_handler;
+# view bodies below are straight-line happy paths.
+
+
+class LabelViewSet(ListModelMixin, CreateModelMixin, GenericAPIView):
+    """List the authenticated user's labels and create new ones."""
+
+    queryset = Label.objects.select_related('user').only('id', 'name', 'color', 'user_id')
+    serializer_class = LabelSerializer
+    pagination_class = LabelPagination
+    permission_classes = [IsAuthenticated]
+    authentication_classes = [CachedJWTAuthentication]
+
+    def get_queryset(self):
+        if getattr(self, 'swagger_fake_view', False):
+            return _EMPTY
+        # DRF calls get_queryset several times per request (get_object,
+        # filter_queryset, paginate_queryset); build the filtered chain once.
+        queryset = getattr(self, '_queryset_cache', None)
+        if queryset is None:
+            queryset = (
+                Label.objects.filter(user_id=self.request.user.id)
+                .only('id', 'name', 'color', 'user_id')
+                .order_by('id')
+            )
+            self._queryset_cache = queryset
+        return queryset
+
+    def get(self, request, *args, **kwargs):
+        page_number = request.query_params.get('page', '1')
+        key = f"{_labels_cache_key(request.user.id)}:p{page_number}"
+        data = cache.get(key)
+        if data is not None:
+            # Cache hit: skip DRF content negotiation and rendering
+            # entirely; orjson emits the response bytes directly.
+            return HttpResponse(
+                orjson.dumps(
+                    {
+                        "message": "Successfully fetched labels.",
+                        "status": "success",
+                        "data": data,
+                    }
+                ),
+                content_type='application/json',
+            )
+        # values('user') yields the raw user_id under the serializer's
+        # key name, so the serializer is skipped entirely on reads.
+        queryset = self.get_queryset().order_by('id').values(
+            'id', 'name', 'color', 'user'
+        )
+        page = self.paginate_queryset(queryset)
+        data = list(page) if page is not None else list(queryset)
+        cache.set(key, data, LABEL_CACHE_TIMEOUT)
+        logger.debug("Successfully fetched labels for user.")
+        return Response(
+            {
+                "message": "Successfully fetched labels.",
+                "status": "success",
+                "data": data,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    @swagger(_label_body_schema)
+    def post(self, request, *args, **kwargs):
+        if isinstance(request.data, list):
+            # Batch payload: one multi-row INSERT via the list
+            # serializer instead of N single-label requests.
+            serializer = self.get_serializer(data=request.data, many=True)
+            serializer.is_valid(raise_exception=True)
+            labels = serializer.save(user_id=request.user.id)
+            _bump_labels_version(request.user.id)
+            logger.debug("Labels bulk-created successfully.")
+            return Response(
+                {
+                    "message": "Labels created successfully.",
+                    "status": "success",
+                    "data": [
+                        {
+                            "id": label.id,
+                            "name": label.name,
+                            "color": label.color,
+                            "user": request.user.id,
+                        }
+                        for label in labels
+                    ],
+                },
+                status=status.HTTP_201_CREATED,
+            )
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        # Single INSERT ... RETURNING round-trip; skips the ORM's save
+        # machinery (signals, pre_save hooks) on the write hot path.
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO labels_label (name, color, user_id) "
+                "VALUES (%s, %s, %s) RETURNING id",
+                [data['name'], data.get('color'), request.user.id],
+            )
+            new_id = cursor.fetchone()[0]
+        _bump_labels_version(request.user.id)
+        logger.debug("Label created successfully.")
+        return Response(
+            {
+                "message": "Label created successfully.",
+                "status": "success",
+                "data": {
+                    "id": new_id,
+                    "name": data['name'],
+                    "color": data.get('color'),
+                    "user": request.user.id,
+                },
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+
+class LabelBulkCreateView(GenericAPIView):
+    """Create many labels in one request with a single multi-row INSERT."""
+
+    queryset = Label.objects.select_related('user').only('id', 'name', 'color', 'user_id')
+    serializer_class = LabelSerializer
+    permission_classes = [IsAuthenticated]
+    authentication_classes = [CachedJWTAuthentication]
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+        labels = Label.objects.bulk_create(
+            [
+                Label(user_id=request.user.id, **item)
+                for item in serializer.validated_data
+            ],
+            batch_size=500,
+        )
+        _bump_labels_version(request.user.id)
+        logger.debug("Labels bulk-created successfully.")
+        return Response(
+            {
+                "message": "Labels created successfully.",
+                "status": "success",
+                "data": [
+                    {
+                        "id": label.id,
+                        "name": label.name,
+                        "color": label.color,
+                        "user": request.user.id,
+                    }
+                    for label in labels
+                ],
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+
+class LabelViewSetByID(UpdateModelMixin, DestroyModelMixin, GenericAPIView):
+    """Update or delete a single label owned by the authenticated user."""
+
+    queryset = Label.objects.select_related('user').only('id', 'name', 'color', 'user_id')
+    serializer_class = LabelSerializer
+    permission_classes = [IsAuthenticated]
+    authentication_classes = [CachedJWTAuthentication]
+
+    def get_queryset(self):
+        if getattr(self, 'swagger_fake_view', False):
+            return _EMPTY
+        # DRF calls get_queryset several times per request (get_object,
+        # filter_queryset, paginate_queryset); build the filtered chain once.
+        queryset = getattr(self, '_queryset_cache', None)
+        if queryset is None:
+            queryset = (
+                Label.objects.filter(user_id=self.request.user.id)
+                .only('id', 'name', 'color', 'user_id')
+                .order_by('id')
+            )
+            self._queryset_cache = queryset
+        return queryset
+
+    @swagger(_label_body_schema)
+    def put(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        # Single UPDATE with ownership folded into the WHERE clause;
+        # no SELECT-before-save and no full-row write.
+        rows = Label.objects.filter(
+            pk=kwargs['pk'], user_id=request.user.id
+        ).update(**serializer.validated_data)
+        if rows == 0:
+            return Response(
+                {"message": "Label not found.", "status": "error"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        _bump_labels_version(request.user.id)
+        logger.debug("Label updated successfully.")
+        return Response(
+            {
+                "message": "Label updated successfully.",
+                "status": "success",
+                "data": {"id": kwargs['pk'], **serializer.validated_data},
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    def delete(self, request, *args, **kwargs):
+        rows = Label.objects.filter(
+            pk=kwargs['pk'], user_id=request.user.id
+        ).delete()[0]
+        if rows == 0:
+            return Response(
+                {"message": "Label not found.", "status": "error"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        _bump_labels_version(request.user.id)
+        logger.debug("Label deleted successfully.")
+        return Response(
+            {"message": "Label deleted successfully.", "status": "success"},
+            status=status.HTTP_204_NO_CONTENT,
+        )
+
+
+class RawSQLLabelView(APIView):
+    """List and create labels using raw SQL queries."""
+
+    permission_classes = [IsAuthenticated]
+    authentication_classes = [CachedJWTAuthentication]
+
+    def get(self, request):
+        key = f"{_labels_cache_key(request.user.id)}:raw"
+        labels = cache.get(key)
+        if labels is not None:
+            return HttpResponse(
+                orjson.dumps(
+                    {
+                        "message": "Successfully fetched labels.",
+                        "status": "success",
+                        "data": labels,
+                    }
+                ),
+                content_type='application/json',
+            )
+        labels = list(
+            Label.objects.filter(user_id=request.user.id).values(
+                'id', 'name', 'color', 'user'
+            )
+        )
+        cache.set(key, labels, LABEL_CACHE_TIMEOUT)
+        logger.debug("Successfully fetched labels via raw SQL.")
+        return Response(
+            {
+                "message": "Successfully fetched labels.",
+                "status": "success",
+                "data": labels,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    @swagger(_label_body_schema)
+    def post(self, request):
+        serializer = LabelSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO labels_label (name, color, user_id) "
+                "VALUES (%s, %s, %s) RETURNING id, name, color, user_id",
+                [data['name'], data.get('color'), request.user.id],
+            )
+            columns = [col.name for col in cursor.description]
+            label = dict(zip(columns, cursor.fetchone()))
+        label['user'] = label.pop('user_id')
+        _bump_labels_version(request.user.id)
+        logger.debug("Label created successfully via raw SQL.")
+        return Response(
+            {
+                "message": "Label created successfully.",
+                "status": "success",
+                "data": label,
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+
+class RawSQLLabelViewByID(APIView):
+    """Update and delete a single label using raw SQL queries."""
+
+    permission_classes = [IsAuthenticated]
+    authentication_classes = [CachedJWTAuthentication]
+
+    @swagger(_label_body_schema)
+    def put(self, request, pk):
+        serializer = LabelSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "UPDATE labels_label SET name = %s, color = %s "
+                "WHERE id = %s AND user_id = %s "
+                "RETURNING id, name, color, user_id",
+                [data['name'], data.get('color'), pk, request.user.id],
+            )
+            columns = [col.name for col in cursor.description]
+            updated_label = cursor.fetchone()
+        if updated_label is None:
+            return Response(
+                {"message": "Label not found.", "status": "error"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        label = dict(zip(columns, updated_label))
+        label['user'] = label.pop('user_id')
+        _bump_labels_version(request.user.id)
+        logger.debug("Label updated successfully via raw SQL.")
+        return Response(
+            {
+                "message": "Label updated successfully.",
+                "status": "success",
+                "data": label,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    def delete(self, request, pk):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "DELETE FROM labels_label WHERE id = %s AND user_id = %s RETURNING id",
+                [pk, request.user.id],
+            )
+            deleted = cursor.fetchone()
+        if deleted is None:
+            return Response(
+                {"message": "Label not found.", "status": "error"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        _bump_labels_version(request.user.id)
+        logger.debug("Label deleted successfully via raw SQL.")
+        return Response(
+            {"message": "Label deleted successfully.", "status": "success"},
+            status=status.HTTP_204_NO_CONTENT,
+        )
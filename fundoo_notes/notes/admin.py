@@ -0,0 +1,6 @@
+from django.contrib import admin
+
+from .models import Collaborator, Note
+
+admin.site.register(Note)
+admin.site.register(Collaborator)
@@ -0,0 +1,49 @@
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('labels', '0002_label_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Note',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=255)),
+                ('description', models.TextField(blank=True, null=True)),
+                ('color', models.CharField(blank=True, max_length=255, null=True)),
+                ('reminder', models.DateTimeField(blank=True, null=True)),
+                ('is_archive', models.BooleanField(default=False)),
+                ('is_trash', models.BooleanField(default=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('labels', models.ManyToManyField(blank=True, related_name='notes', to='labels.label')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='notes', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Collaborator',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('access_type', models.CharField(choices=[('read_only', 'Read Only'), ('read_write', 'Read Write')], default='read_only', max_length=20)),
+                ('note', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='notes.note')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'unique_together': {('note', 'user')},
+            },
+        ),
+        migrations.AddField(
+            model_name='note',
+            name='collaborators',
+            field=models.ManyToManyField(blank=True, related_name='collaborated_notes', through='notes.Collaborator', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
@@ -0,0 +1,34 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notes', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='note',
+            index=models.Index(
+                fields=['user', 'is_archive', 'is_trash'],
+                name='notes_user_state_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='note',
+            index=models.Index(
+                condition=models.Q(('is_trash', True)),
+                fields=['user'],
+                name='notes_trashed_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='note',
+            index=models.Index(
+                condition=models.Q(('is_archive', False), ('is_trash', False)),
+                fields=['user'],
+                name='notes_active_idx',
+            ),
+        ),
+    ]
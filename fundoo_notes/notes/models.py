@@ -0,0 +1,66 @@
+from django.conf import settings
+from django.db import models
+
+from labels.models import Label
+
+
+class Note(models.Model):
+    title = models.CharField(max_length=255)
+    description = models.TextField(null=True, blank=True)
+    color = models.CharField(max_length=255, null=True, blank=True)
+    reminder = models.DateTimeField(null=True, blank=True)
+    is_archive = models.BooleanField(default=False)
+    is_trash = models.BooleanField(default=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='notes'
+    )
+    collaborators = models.ManyToManyField(
+        settings.AUTH_USER_MODEL,
+        through='Collaborator',
+        related_name='collaborated_notes',
+        blank=True,
+    )
+    labels = models.ManyToManyField(Label, related_name='notes', blank=True)
+
+    class Meta:
+        # Composite and partial indexes matching the list/archived/trashed
+        # filters, so the hot per-user queries become index scans.
+        indexes = [
+            models.Index(
+                fields=['user', 'is_archive', 'is_trash'],
+                name='notes_user_state_idx',
+            ),
+            models.Index(
+                fields=['user'],
+                condition=models.Q(is_trash=True),
+                name='notes_trashed_idx',
+            ),
+            models.Index(
+                fields=['user'],
+                condition=models.Q(is_archive=False, is_trash=False),
+                name='notes_active_idx',
+            ),
+        ]
+
+    def __str__(self):
+        return self.title
+
+
+class Collaborator(models.Model):
+    READ_ONLY = 'read_only'
+    READ_WRITE = 'read_write'
+    ACCESS_CHOICES = [
+        (READ_ONLY, 'Read Only'),
+        (READ_WRITE, 'Read Write'),
+    ]
+
+    note = models.ForeignKey(Note, on_delete=models.CASCADE)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    access_type = models.CharField(
+        max_length=20, choices=ACCESS_CHOICES, default=READ_ONLY
+    )
+
+    class Meta:
+        unique_together = ('note', 'user')
@@ -0,0 +1,47 @@
+from rest_framework import serializers
+
+from .models import Note
+
+
+class NoteSerializer(serializers.ModelSerializer):
+    user = serializers.PrimaryKeyRelatedField(read_only=True)
+    collaborators = serializers.PrimaryKeyRelatedField(many=True, read_only=True)
+    labels = serializers.PrimaryKeyRelatedField(many=True, read_only=True)
+
+    class Meta:
+        model = Note
+        fields = [
+            'id',
+            'title',
+            'description',
+            'color',
+            'reminder',
+            'is_archive',
+            'is_trash',
+            'user',
+            'collaborators',
+            'labels',
+        ]
+
+
+class NoteListSerializer(serializers.ModelSerializer):
+    """Scalar-only projection for list endpoints.
+
+    Skips the collaborators/labels M2M fields so rendering a page of
+    notes never fans out into per-row relation queries.
+    """
+
+    user = serializers.PrimaryKeyRelatedField(read_only=True)
+
+    class Meta:
+        model = Note
+        fields = [
+            'id',
+            'title',
+            'description',
+            'color',
+            'reminder',
+            'is_archive',
+            'is_trash',
+            'user',
+        ]
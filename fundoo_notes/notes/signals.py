@@ -0,0 +1,17 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Note
+from .utils import cache_note_row, evict_note_row, note_row
+
+
+@receiver(post_save, sender=Note)
+def _note_saved(sender, instance, **kwargs):
+    # Refresh just this note's hash field; covers every ORM save,
+    # including writes that bypass the viewset (admin, shell, tasks).
+    cache_note_row(instance.user_id, note_row(instance))
+
+
+@receiver(post_delete, sender=Note)
+def _note_deleted(sender, instance, **kwargs):
+    evict_note_row(instance.user_id, instance.id)
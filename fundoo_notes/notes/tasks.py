@@ -0,0 +1,87 @@
+from celery import shared_task
+from celery.signals import worker_process_shutdown
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from loguru import logger
+
+# One SMTP connection per worker process: the TCP+TLS handshake dwarfs the
+# cost of sending a single message, so keep the connection open and reuse it.
+_connection = None
+
+
+def _smtp_connection():
+    global _connection
+    if _connection is None:
+        _connection = get_connection()
+        _connection.open()
+    return _connection
+
+
+@worker_process_shutdown.connect
+def _close_smtp_connection(**kwargs):
+    global _connection
+    if _connection is not None:
+        _connection.close()
+        _connection = None
+
+
+# Fire-and-forget: no result-backend write per task, ack on receipt, and
+# let Celery retry transient SMTP failures with exponential backoff
+# instead of swallowing them locally.
+@shared_task(
+    ignore_result=True,
+    acks_late=False,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    max_retries=3,
+)
+def send_reminder_email(title, email):
+    """Send a reminder email for a note."""
+    try:
+        EmailMessage(
+            subject=f"Reminder: {title}",
+            body=f"This is a reminder for your note: {title}",
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            to=[email],
+            connection=_smtp_connection(),
+        ).send()
+    except Exception:
+        # Drop the broken connection so the retry reconnects cleanly.
+        _close_smtp_connection()
+        raise
+    logger.debug("Reminder email sent successfully.")
+
+
+@shared_task(ignore_result=True)
+def send_reminder_emails_batch(messages):
+    """Send many (title, email) reminders over the one open connection."""
+    connection = _smtp_connection()
+    for title, email in messages:
+        EmailMessage(
+            subject=f"Reminder: {title}",
+            body=f"This is a reminder for your note: {title}",
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            to=[email],
+            connection=connection,
+        ).send()
+
+
+@shared_task(
+    ignore_result=True,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    max_retries=5,
+)
+def schedule_reminder_task(note_id):
+    """Register a note's reminder schedule off the request thread.
+
+    Takes only the pk so the broker payload stays tiny; the worker
+    re-reads the row, which is guaranteed visible because callers
+    enqueue via transaction.on_commit.
+    """
+    from .models import Note
+    from .schedule import schedule_reminder
+
+    note = Note.objects.select_related('user').filter(pk=note_id).first()
+    if note is not None and note.reminder is not None:
+        schedule_reminder(note, user_email=note.user.email)
@@ -0,0 +1,258 @@
+import orjson
+import pytest
+from django.urls import reverse_lazy
+
+# Resolve URLs once at import instead of walking the resolver per test.
+NOTES_LIST_URL = reverse_lazy('notes-list')
+ARCHIVED_URL = reverse_lazy('notes-archived')
+TRASHED_URL = reverse_lazy('notes-trashed')
+ADD_COLLAB_URL = reverse_lazy('notes-add-collaborator')
+REMOVE_COLLAB_URL = reverse_lazy('notes-remove-collaborator')
+ADD_LABELS_URL = reverse_lazy('notes-add-labels')
+REMOVE_LABELS_URL = reverse_lazy('notes-remove-labels')
+
+
+def detail_url(note_id):
+    return f"{NOTES_LIST_URL}{note_id}/"
+
+
+def toggle_archive_url(note_id):
+    return f"{NOTES_LIST_URL}{note_id}/toggle_archive/"
+
+
+def toggle_trash_url(note_id):
+    return f"{NOTES_LIST_URL}{note_id}/toggle_trash/"
+
+
+def payload(response):
+    """Decode a list response; the default path returns spliced orjson
+    bytes via HttpResponse, which has no .data attribute."""
+    return orjson.loads(response.content)
+
+
+@pytest.fixture(scope='session')
+def user_factory(django_db_setup, django_db_blocker):
+    """Session-cached user factory; each named user is created once via
+    the ORM (no /register round-trip or repeated password hashing)."""
+    from user.models import CustomUser
+
+    users = {}
+
+    def make(username):
+        user_data = users.get(username)
+        if user_data is None:
+            user_data = {
+                "username": username,
+                "email": f"{username}@gmail.com",
+                "password": "Password@123",
+            }
+            with django_db_blocker.unblock():
+                # Idempotent for --reuse-db: these rows are committed
+                # outside the test transaction and survive the run.
+                user = CustomUser.objects.filter(
+                    email=user_data["email"]
+                ).first()
+                if user is None:
+                    user = CustomUser.objects.create_user(**user_data)
+            user_data["id"] = user.id
+            users[username] = user_data
+        return user_data
+
+    return make
+
+
+@pytest.fixture(scope='session')
+def user_and_token(user_factory, django_db_blocker):
+    """The main user and their in-process JWT, set up once per session."""
+    from rest_framework_simplejwt.tokens import RefreshToken
+    from user.models import CustomUser
+
+    user_data = user_factory("noteuser")
+    with django_db_blocker.unblock():
+        user = CustomUser.objects.get(pk=user_data["id"])
+    return user_data, str(RefreshToken.for_user(user).access_token)
+
+
+@pytest.fixture(scope='session')
+def create_user(user_and_token):
+    return user_and_token[0]
+
+
+@pytest.fixture(scope='session')
+def create_user_two(user_factory):
+    return user_factory("noteusertwo")
+
+
+@pytest.fixture(scope='session')
+def generate_usertoken(user_and_token):
+    return user_and_token[1]
+
+
+@pytest.fixture(scope='session')
+def label_pool(create_user, django_db_blocker):
+    """Pre-create a shared pool of labels with one multi-row INSERT."""
+    from labels.models import Label
+
+    names = [f"L{i}" for i in range(5)]
+    with django_db_blocker.unblock():
+        # Reuse rows committed by a previous --reuse-db run.
+        have = set(
+            Label.objects.filter(
+                user_id=create_user["id"], name__in=names
+            ).values_list('name', flat=True)
+        )
+        Label.objects.bulk_create(
+            [
+                Label(name=name, user_id=create_user["id"])
+                for name in names
+                if name not in have
+            ]
+        )
+        return list(
+            Label.objects.filter(user_id=create_user["id"], name__in=names)
+        )
+
+
+@pytest.fixture
+def client(generate_usertoken):
+    """APIClient with the session JWT attached once; posts native dicts
+    with format='json' so tests skip manual json.dumps calls."""
+    from rest_framework.test import APIClient
+
+    api_client = APIClient()
+    api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {generate_usertoken}')
+    return api_client
+
+
+@pytest.fixture
+def fresh_note(db, user_and_token):
+    """Seed a note with a single INSERT; only tests that assert HTTP
+    behaviour go through the full request stack."""
+    from notes.models import Note
+
+    note = Note.objects.create(
+        user_id=user_and_token[0]["id"],
+        title="Test Notes",
+        description="This is a test note.",
+        color="violet",
+    )
+    return note.id
+
+
+@pytest.mark.django_db
+class TestNotesSuccess:
+
+    def test_note_create(self, client):
+        response = client.post(
+            NOTES_LIST_URL,
+            data={"title": "Groceries", "description": "Milk, eggs"},
+            format='json',
+        )
+        assert response.status_code == 201
+        assert response.data["data"]["title"] == "Groceries"
+
+    def test_note_list(self, client, fresh_note):
+        response = client.get(NOTES_LIST_URL)
+        assert response.status_code == 200
+        assert len(payload(response)["data"]) == 1
+
+    def test_note_retrieve(self, client, fresh_note):
+        response = client.get(detail_url(fresh_note))
+        assert response.status_code == 200
+        assert response.data["data"]["id"] == fresh_note
+
+    def test_note_update(self, client, fresh_note):
+        response = client.put(
+            detail_url(fresh_note),
+            data={"title": "Updated Notes"},
+            format='json',
+        )
+        assert response.status_code == 200
+        assert response.data["data"]["title"] == "Updated Notes"
+
+    def test_note_delete(self, client, fresh_note):
+        response = client.delete(detail_url(fresh_note))
+        assert response.status_code == 204
+
+    def test_toggle_archive(self, client, fresh_note):
+        response = client.patch(toggle_archive_url(fresh_note))
+        assert response.status_code == 200
+        assert response.data["data"]["is_archive"] is True
+
+    def test_archived_list(self, client, fresh_note):
+        client.patch(toggle_archive_url(fresh_note))
+        response = client.get(ARCHIVED_URL)
+        assert response.status_code == 200
+        assert len(payload(response)["data"]) == 1
+
+    def test_toggle_trash(self, client, fresh_note):
+        response = client.patch(toggle_trash_url(fresh_note))
+        assert response.status_code == 200
+        assert response.data["data"]["is_trash"] is True
+
+    def test_trashed_list(self, client, fresh_note):
+        client.patch(toggle_trash_url(fresh_note))
+        response = client.get(TRASHED_URL)
+        assert response.status_code == 200
+        assert len(payload(response)["data"]) == 1
+
+    def test_add_collaborator(
+        self, client, fresh_note, create_user_two
+    ):
+        response = client.post(
+            ADD_COLLAB_URL,
+            data={"note_id": fresh_note, "user_ids": [create_user_two["id"]]},
+            format='json',
+        )
+        assert response.status_code == 200
+
+    def test_remove_collaborator(
+        self, client, fresh_note, create_user_two
+    ):
+        from notes.models import Collaborator
+
+        Collaborator.objects.create(
+            note_id=fresh_note, user_id=create_user_two["id"]
+        )
+        response = client.post(
+            REMOVE_COLLAB_URL,
+            data={"note_id": fresh_note, "user_ids": [create_user_two["id"]]},
+            format='json',
+        )
+        assert response.status_code == 200
+
+    def test_add_labels(self, client, fresh_note, label_pool):
+        response = client.post(
+            ADD_LABELS_URL,
+            data={"note_id": fresh_note, "label_ids": [label_pool[0].id]},
+            format='json',
+        )
+        assert response.status_code == 200
+
+    def test_remove_labels(self, client, fresh_note, label_pool):
+        from notes.models import Note
+
+        Note.objects.get(pk=fresh_note).labels.add(label_pool[1])
+        response = client.post(
+            REMOVE_LABELS_URL,
+            data={"note_id": fresh_note, "label_ids": [label_pool[1].id]},
+            format='json',
+        )
+        assert response.status_code == 200
+
+
+@pytest.mark.django_db
+class TestNotesFailure:
+
+    def test_note_create_invalid_token(self, client):
+        client.credentials(HTTP_AUTHORIZATION='Bearer invalid-token')
+        response = client.post(NOTES_LIST_URL, {"title": "Groceries"}, format='json')
+        assert response.status_code == 401
+
+    def test_note_retrieve_invalid_id(self, client):
+        response = client.get(detail_url(999))
+        assert response.status_code == 404
+
+    def test_note_delete_invalid_id(self, client):
+        response = client.delete(detail_url(999))
+        assert response.status_code == 404
@@ -0,0 +1,11 @@
+from django.urls import include, path
+from rest_framework.routers import DefaultRouter
+
+from .views import NoteViewSet
+
+router = DefaultRouter()
+router.register('', NoteViewSet, basename='notes')
+
+urlpatterns = [
+    path('', include(router.urls)),
+]
@@ -0,0 +1,184 @@
+from functools import lru_cache
+
+import orjson
+
+
+class RedisUtils:
+    """Thin wrapper around the raw django-redis client for note data.
+
+    Only the operations the hash/bucket cache actually uses live here;
+    everything multi-command goes through pipeline().
+    """
+
+    DEFAULT_TIMEOUT = 3600
+
+    @staticmethod
+    def get_cache_key(user_id):
+        return f"user_{user_id}"
+
+    @staticmethod
+    def client():
+        from django_redis import get_redis_connection
+
+        return get_redis_connection('default')
+
+    @classmethod
+    def pipeline(cls):
+        """Buffer several commands into one round-trip; commands queue
+        until execute() and run atomically as a MULTI/EXEC block."""
+        return cls.client().pipeline()
+
+    @classmethod
+    def hmget(cls, key, fields):
+        return cls.client().hmget(key, fields)
+
+    @classmethod
+    def smembers(cls, key):
+        return cls.client().smembers(key)
+
+    @classmethod
+    def exists(cls, key):
+        return bool(cls.client().exists(key))
+
+
+@lru_cache(maxsize=4096)
+def note_hash_key(user_id):
+    """Key of the Redis hash holding all of a user's notes by note id.
+
+    Pure function of the user id, so the f-string is built once per
+    user per process instead of on every cache touch.
+    """
+    return f"{RedisUtils.get_cache_key(user_id)}:notes"
+
+
+# Bucket id-sets sit next to the hash so the archive/trash predicate is
+# resolved in Redis (SMEMBERS + HMGET) instead of a Python scan.
+NOTE_BUCKETS = ('active', 'archived', 'trashed')
+
+
+@lru_cache(maxsize=4096)
+def note_bucket_key(user_id, bucket):
+    return f"{note_hash_key(user_id)}:{bucket}"
+
+
+def bucket_for(row):
+    if row['is_trash']:
+        return 'trashed'
+    if row['is_archive']:
+        return 'archived'
+    return 'active'
+
+
+def note_row(note):
+    """The list-projection dict for one Note instance."""
+    return {
+        'id': note.id,
+        'title': note.title,
+        'description': note.description,
+        'color': note.color,
+        'reminder': note.reminder,
+        'is_archive': note.is_archive,
+        'is_trash': note.is_trash,
+        'user': note.user_id,
+    }
+
+
+def cache_note_row(user_id, row):
+    """O(1) single-field refresh after a write, moving the id to its
+    current bucket set. No-op while the hash is unprimed, so a partial
+    hash can never masquerade as the full set."""
+    key = note_hash_key(user_id)
+    if not RedisUtils.exists(key):
+        return
+    bucket = bucket_for(row)
+    with RedisUtils.pipeline() as pipe:
+        pipe.hset(key, str(row['id']), orjson.dumps(row))
+        for other in NOTE_BUCKETS:
+            if other != bucket:
+                pipe.srem(note_bucket_key(user_id, other), row['id'])
+        pipe.sadd(note_bucket_key(user_id, bucket), row['id'])
+        pipe.execute()
+
+
+def evict_note_row(user_id, note_id):
+    with RedisUtils.pipeline() as pipe:
+        pipe.hdel(note_hash_key(user_id), str(note_id))
+        for bucket in NOTE_BUCKETS:
+            pipe.srem(note_bucket_key(user_id, bucket), note_id)
+        pipe.execute()
+
+
+# ---------------------------------------------------------------------------
+# Note-cache bookkeeping. Every read, prime, refresh, and eviction lives
+# here (plus the signal receivers in notes.signals), so the views never
+# hand-roll cache mutations; they only call in.
+# ---------------------------------------------------------------------------
+
+# values() projection of the columns the list endpoints render; 'user'
+# yields the raw FK id under the serializer's key name, so read-only
+# endpoints skip model and serializer construction entirely.
+NOTE_LIST_VALUES = (
+    'id', 'title', 'description', 'color', 'reminder',
+    'is_archive', 'is_trash', 'user',
+)
+
+# Users above this many notes are served from the DB instead of Redis:
+# the prime would write a multi-hundred-KB burst per cold hit and pin
+# that much memory per hot user, while the indexed DB query stays fast.
+CACHE_MAX_NOTES = 500
+
+
+def prime_note_cache(user_id):
+    """Load every note row once, storing one hash field per note id and
+    one id-set per bucket."""
+    from .models import Note
+
+    rows = list(Note.objects.filter(user_id=user_id).values(*NOTE_LIST_VALUES))
+    if rows and len(rows) <= CACHE_MAX_NOTES:
+        # One pipelined round-trip for the hash plus all three bucket
+        # sets; each set is rebuilt from scratch and expires with the
+        # hash so stale ids can't outlive a re-prime.
+        with RedisUtils.pipeline() as pipe:
+            pipe.hset(
+                note_hash_key(user_id),
+                mapping={str(row['id']): orjson.dumps(row) for row in rows},
+            )
+            pipe.expire(note_hash_key(user_id), RedisUtils.DEFAULT_TIMEOUT)
+            for bucket in NOTE_BUCKETS:
+                key = note_bucket_key(user_id, bucket)
+                pipe.delete(key)
+                ids = [row['id'] for row in rows if bucket_for(row) == bucket]
+                if ids:
+                    pipe.sadd(key, *ids)
+                pipe.expire(key, RedisUtils.DEFAULT_TIMEOUT)
+            pipe.execute()
+    return rows
+
+
+def bucket_blobs(user_id, bucket):
+    """One bucket's notes as raw orjson blobs, newest first, resolved
+    entirely in Redis (SMEMBERS + HMGET). Returning the stored bytes
+    lets a hit splice them straight into the response body with no
+    per-row decode/encode cycle."""
+    if not RedisUtils.exists(note_hash_key(user_id)):
+        rows = sorted(
+            (r for r in prime_note_cache(user_id) if bucket_for(r) == bucket),
+            key=lambda r: r['id'],
+            reverse=True,
+        )
+        return [orjson.dumps(row) for row in rows]
+    ids = RedisUtils.smembers(note_bucket_key(user_id, bucket))
+    if not ids:
+        return []
+    raw = RedisUtils.hmget(note_hash_key(user_id), sorted(ids, key=int, reverse=True))
+    return [blob for blob in raw if blob is not None]
+
+
+def refresh_note_row(user_id, note_id):
+    """Re-read one row and refresh its hash field and bucket (used after
+    raw SQL writes where no model instance is in hand)."""
+    from .models import Note
+
+    row = Note.objects.filter(pk=note_id).values(*NOTE_LIST_VALUES).first()
+    if row is not None:
+        cache_note_row(user_id, row)
@@ -0,0 +1,433 @@
+import orjson
+from django.db import connection, transaction
+from django.db.models import Prefetch
+from django.http import HttpResponse
+from loguru import logger
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.viewsets import ModelViewSet
+from user.authentication import CachedJWTAuthentication
+from user.models import CustomUser
+
+from labels.models import Label
+
+from .models import Collaborator, Note
+from .serializer import NoteListSerializer, NoteSerializer
+from .utils import NOTE_LIST_VALUES, bucket_blobs, refresh_note_row
+
+# Bound once at import: every record carries the view context without
+# per-call f-string work; happy-path messages stay constant strings at
+# DEBUG so production (WARNING) pays only a level check.
+logger = logger.bind(view="NoteViewSet")
+
+
+class NotePagination(LimitOffsetPagination):
+    """Caps archive/trash dumps so a user with thousands of notes never
+    materializes them all in one response."""
+
+    default_limit = 100
+
+
+# Columns the list endpoints actually render; keeps SELECTs narrow.
+NOTE_LIST_FIELDS = (
+    'id', 'title', 'description', 'color', 'reminder',
+    'is_archive', 'is_trash', 'user_id',
+)
+
+# The three list views differ only by these predicates (and they mirror
+# the cache buckets), so one code path serves all of them.
+VIEW_FILTERS = {
+    'active': {'is_archive': False, 'is_trash': False},
+    'archived': {'is_archive': True, 'is_trash': False},
+    'trashed': {'is_trash': True},
+}
+
+VIEW_MESSAGES = {
+    'active': "Successfully fetched notes.",
+    'archived': "Successfully fetched archived notes.",
+    'trashed': "Successfully fetched trashed notes.",
+}
+
+# Envelope openings precomputed once: a cache hit only joins the stored
+# per-note blobs between prefix and suffix, touching no serializer and
+# decoding nothing.
+VIEW_BODY_PREFIX = {
+    view: b'{"message":' + orjson.dumps(msg) + b',"status":"success","data":['
+    for view, msg in VIEW_MESSAGES.items()
+}
+
+
+class NoteViewSet(ModelViewSet):
+    """CRUD plus archive/trash/collaborator/label actions for notes."""
+
+    queryset = Note.objects.all()
+    serializer_class = NoteSerializer
+    permission_classes = [IsAuthenticated]
+    authentication_classes = [CachedJWTAuthentication]
+
+    def get_queryset(self):
+        if getattr(self, 'swagger_fake_view', False):
+            return Note.objects.none()
+        queryset = Note.objects.filter(user_id=self.request.user.id)
+        if self.action == 'list':
+            return (
+                queryset.filter(is_archive=False, is_trash=False)
+                .only(*NOTE_LIST_FIELDS)
+                .order_by('-id')
+            )
+        if self.action == 'retrieve':
+            # Both M2M fields render as pk lists, so the prefetches only
+            # need narrow rows; two fixed queries regardless of fan-out.
+            return queryset.prefetch_related(
+                Prefetch(
+                    'collaborators',
+                    queryset=CustomUser.objects.only('id', 'email'),
+                ),
+                Prefetch('labels', queryset=Label.objects.only('id', 'name')),
+            )
+        return queryset
+
+    def get_serializer_class(self):
+        # The scalar-only serializer for list shapes; full shape elsewhere.
+        if self.action in ('list', 'archived', 'trashed'):
+            return NoteListSerializer
+        return NoteSerializer
+
+    def _bucket_response(self, request, bucket):
+        """Shared implementation behind list/archived/trashed: cached
+        bucket read by default, DB pagination when limit/offset given."""
+        if 'limit' in request.query_params or 'offset' in request.query_params:
+            notes = Note.objects.filter(
+                user_id=request.user.id, **VIEW_FILTERS[bucket]
+            ).values(*NOTE_LIST_VALUES).order_by('-id')
+            page = NotePagination().paginate_queryset(notes, request, view=self)
+            return Response(
+                {
+                    "message": VIEW_MESSAGES[bucket],
+                    "status": "success",
+                    "data": list(page),
+                },
+                status=status.HTTP_200_OK,
+            )
+        blobs = bucket_blobs(request.user.id, bucket)[:NotePagination.default_limit]
+        logger.debug("Successfully fetched notes for user.")
+        return HttpResponse(
+            VIEW_BODY_PREFIX[bucket] + b",".join(blobs) + b"]}",
+            content_type='application/json',
+        )
+
+    def list(self, request, *args, **kwargs):
+        view = request.query_params.get('view', 'active')
+        if view not in VIEW_FILTERS:
+            view = 'active'
+        return self._bucket_response(request, view)
+
+    def create(self, request, *args, **kwargs):
+        # No blanket catch: ValidationError and DatabaseError map to
+        # 400/500 in the project exception handler, which never leaks
+        # raw exception text to the client.
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        note = serializer.save(user=request.user)
+        if note.reminder:
+            # Deferred import: Celery + django.core.mail only load in
+            # workers that actually schedule a reminder, keeping the
+            # pre-fork baseline RSS down.
+            from .tasks import schedule_reminder_task
+
+            # After commit so the worker can't read the row before
+            # it is visible; only the pk crosses the broker.
+            transaction.on_commit(
+                lambda note_id=note.id: schedule_reminder_task.delay(note_id)
+            )
+        logger.debug("Note created successfully.")
+        return Response(
+            {
+                "message": "Note created successfully.",
+                "status": "success",
+                "data": serializer.data,
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+    def retrieve(self, request, pk=None, *args, **kwargs):
+        note = self.get_queryset().filter(pk=pk).first()
+        if note is None:
+            return Response(
+                {"message": "Note not found.", "status": "error"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        serializer = self.get_serializer(note)
+        logger.debug("Note retrieved successfully.")
+        return Response(
+            {
+                "message": "Note retrieved successfully.",
+                "status": "success",
+                "data": serializer.data,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    def update(self, request, pk=None, *args, **kwargs):
+        note = Note.objects.filter(pk=pk, user_id=request.user.id).first()
+        if note is None:
+            return Response(
+                {"message": "Note not found.", "status": "error"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        serializer = self.get_serializer(note, data=request.data, partial=True)
+        serializer.is_valid(raise_exception=True)
+        note = serializer.save()
+        if note.reminder:
+            from .tasks import schedule_reminder_task
+
+            transaction.on_commit(
+                lambda note_id=note.id: schedule_reminder_task.delay(note_id)
+            )
+        logger.debug("Note updated successfully.")
+        return Response(
+            {
+                "message": "Note updated successfully.",
+                "status": "success",
+                "data": serializer.data,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    def destroy(self, request, pk=None, *args, **kwargs):
+        try:
+            # Authorization folded into the DELETE's WHERE clause; no
+            # prior SELECT, and the 0-rows case is the 404.
+            deleted, _ = Note.objects.filter(pk=pk, user_id=request.user.id).delete()
+            if deleted == 0:
+                return Response(
+                    {"message": "Note not found.", "status": "error"},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+            logger.debug("Note deleted successfully.")
+            return Response(
+                {"message": "Note deleted successfully.", "status": "success"},
+                status=status.HTTP_204_NO_CONTENT,
+            )
+        except Exception as e:
+            logger.opt(exception=True).error("Unexpected error occurred")
+            return Response(
+                {"message": "Failed to delete note.", "status": "error", "error": str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    @action(detail=False, methods=['get'])
+    def archived(self, request):
+        # Kept as a route for API compatibility; same path as
+        # GET /notes/?view=archived.
+        return self._bucket_response(request, 'archived')
+
+    @action(detail=False, methods=['get'])
+    def trashed(self, request):
+        return self._bucket_response(request, 'trashed')
+
+    @action(detail=True, methods=['patch'])
+    def toggle_archive(self, request, pk=None):
+        try:
+            # One atomic UPDATE ... RETURNING instead of SELECT + save();
+            # also race-free against concurrent toggles.
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute(
+                    "UPDATE notes_note SET is_archive = NOT is_archive "
+                    "WHERE id = %s AND user_id = %s RETURNING is_archive",
+                    [pk, request.user.id],
+                )
+                row = cursor.fetchone()
+            if row is None:
+                return Response(
+                    {"message": "Note not found.", "status": "error"},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+            refresh_note_row(request.user.id, pk)
+            logger.debug("Note archive status toggled.")
+            return Response(
+                {
+                    "message": "Note archive status toggled.",
+                    "status": "success",
+                    "data": {"is_archive": row[0]},
+                },
+                status=status.HTTP_200_OK,
+            )
+        except Exception as e:
+            logger.opt(exception=True).error("Unexpected error occurred")
+            return Response(
+                {"message": "Failed to toggle archive.", "status": "error", "error": str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    @action(detail=True, methods=['patch'])
+    def toggle_trash(self, request, pk=None):
+        try:
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute(
+                    "UPDATE notes_note SET is_trash = NOT is_trash "
+                    "WHERE id = %s AND user_id = %s RETURNING is_trash",
+                    [pk, request.user.id],
+                )
+                row = cursor.fetchone()
+            if row is None:
+                return Response(
+                    {"message": "Note not found.", "status": "error"},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+            refresh_note_row(request.user.id, pk)
+            logger.debug("Note trash status toggled.")
+            return Response(
+                {
+                    "message": "Note trash status toggled.",
+                    "status": "success",
+                    "data": {"is_trash": row[0]},
+                },
+                status=status.HTTP_200_OK,
+            )
+        except Exception as e:
+            logger.opt(exception=True).error("Unexpected error occurred")
+            return Response(
+                {"message": "Failed to toggle trash.", "status": "error", "error": str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    @action(detail=False, methods=['post'], url_path='add-collaborator')
+    def add_collaborator(self, request):
+        try:
+            note_id = request.data.get('note_id')
+            user_ids = request.data.get('user_ids', [])
+            access_type = request.data.get('access_type', 'read_only')
+            if not Note.objects.filter(pk=note_id, user_id=request.user.id).exists():
+                return Response(
+                    {"message": "Note not found.", "status": "error"},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+            # Unsaved pk-only anchor: the M2M managers only need note_id.
+            note = Note(pk=note_id)
+            if request.user.id in user_ids:
+                return Response(
+                    {"message": "Cannot add yourself as a collaborator.", "status": "error"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            valid_ids = set(
+                CustomUser.objects.filter(id__in=user_ids).values_list('id', flat=True)
+            )
+            if valid_ids != set(user_ids):
+                return Response(
+                    {"message": "One or more user IDs are invalid.", "status": "error"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            # One conflict-aware multi-row INSERT: new collaborators are
+            # created and re-added ones get their access_type refreshed,
+            # with no per-row existence check or save() loop.
+            Collaborator.objects.bulk_create(
+                [
+                    Collaborator(note=note, user_id=uid, access_type=access_type)
+                    for uid in valid_ids
+                ],
+                update_conflicts=True,
+                unique_fields=['note', 'user'],
+                update_fields=['access_type'],
+            )
+            logger.debug("Collaborators added successfully.")
+            return Response(
+                {"message": "Collaborators added successfully.", "status": "success"},
+                status=status.HTTP_200_OK,
+            )
+        except Exception as e:
+            logger.opt(exception=True).error("Unexpected error occurred")
+            return Response(
+                {"message": "Failed to add collaborators.", "status": "error", "error": str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    @action(detail=False, methods=['post'], url_path='remove-collaborator')
+    def remove_collaborator(self, request):
+        try:
+            note_id = request.data.get('note_id')
+            user_ids = request.data.get('user_ids', [])
+            if not Note.objects.filter(pk=note_id, user_id=request.user.id).exists():
+                return Response(
+                    {"message": "Note not found.", "status": "error"},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+            # Unsaved pk-only anchor: the M2M managers only need note_id.
+            note = Note(pk=note_id)
+            note.collaborators.remove(*user_ids)
+            logger.debug("Collaborators removed successfully.")
+            return Response(
+                {"message": "Collaborators removed successfully.", "status": "success"},
+                status=status.HTTP_200_OK,
+            )
+        except Exception as e:
+            logger.opt(exception=True).error("Unexpected error occurred")
+            return Response(
+                {"message": "Failed to remove collaborators.", "status": "error", "error": str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    @action(detail=False, methods=['post'], url_path='add-labels')
+    def add_labels(self, request):
+        try:
+            note_id = request.data.get('note_id')
+            label_ids = request.data.get('label_ids', [])
+            if not Note.objects.filter(pk=note_id, user_id=request.user.id).exists():
+                return Response(
+                    {"message": "Note not found.", "status": "error"},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+            valid_ids = set(
+                Label.objects.filter(id__in=label_ids).values_list('id', flat=True)
+            )
+            if valid_ids != set(label_ids):
+                return Response(
+                    {"message": "One or more label IDs are invalid.", "status": "error"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            # One INSERT ... ON CONFLICT DO NOTHING on the through table;
+            # m2m add() would SELECT existing memberships first.
+            through = Note.labels.through
+            through.objects.bulk_create(
+                [through(note_id=note_id, label_id=lid) for lid in valid_ids],
+                ignore_conflicts=True,
+            )
+            logger.debug("Labels added successfully.")
+            return Response(
+                {"message": "Labels added successfully.", "status": "success"},
+                status=status.HTTP_200_OK,
+            )
+        except Exception as e:
+            logger.opt(exception=True).error("Unexpected error occurred")
+            return Response(
+                {"message": "Failed to add labels.", "status": "error", "error": str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    @action(detail=False, methods=['post'], url_path='remove-labels')
+    def remove_labels(self, request):
+        try:
+            note_id = request.data.get('note_id')
+            label_ids = request.data.get('label_ids', [])
+            if not Note.objects.filter(pk=note_id, user_id=request.user.id).exists():
+                return Response(
+                    {"message": "Note not found.", "status": "error"},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+            # Unsaved pk-only anchor: the M2M managers only need note_id.
+            note = Note(pk=note_id)
+            note.labels.remove(*label_ids)
+            logger.debug("Labels removed successfully.")
+            return Response(
+                {"message": "Labels removed successfully.", "status": "success"},
+                status=status.HTTP_200_OK,
+            )
+        except Exception as e:
+            logger.opt(exception=True).error("Unexpected error occurred")
+            return Response(
+                {"message": "Failed to remove labels.", "status": "error", "error": str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
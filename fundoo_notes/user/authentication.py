@@ -0,0 +1,36 @@
+import time
+
+from django.core.cache import cache
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """JWT authentication that caches the user lookup per token.
+
+    Plain JWTAuthentication issues a SELECT on the user table for every
+    request; caching the resolved user against the token's JTI removes
+    that query for the token's remaining lifetime. Call
+    ``invalidate(jti)`` on logout to drop the entry early.
+    """
+
+    # Fallback when the token carries no exp claim.
+    USER_CACHE_TIMEOUT = 60
+
+    def get_user(self, validated_token):
+        key = f"jwt_user:{validated_token['jti']}"
+        user = cache.get(key)
+        if user is not None:
+            return user
+        user = super().get_user(validated_token)
+        timeout = self.USER_CACHE_TIMEOUT
+        exp = validated_token.get('exp')
+        if exp is not None:
+            remaining = int(exp - time.time())
+            if remaining > 0:
+                timeout = remaining
+        cache.set(key, user, timeout)
+        return user
+
+    @staticmethod
+    def invalidate(jti):
+        cache.delete(f"jwt_user:{jti}")
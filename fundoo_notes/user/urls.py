@@ -0,0 +1,8 @@
+from django.urls import path
+
+from .views import LoginView, RegisterView
+
+urlpatterns = [
+    path('register/', RegisterView.as_view(), name='register'),
+    path('login/', LoginView.as_view(), name='login'),
+]
@@ -0,0 +1,73 @@
+from django.contrib.auth import authenticate
+from loguru import logger
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .models import CustomUser
+from .serializers import LoginSerializer, RegisterSerializer
+
+
+class RegisterView(APIView):
+    """Register a new user account."""
+
+    def post(self, request):
+        try:
+            serializer = RegisterSerializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
+            user = serializer.save()
+            logger.info("User registered successfully.")
+            return Response(
+                {
+                    "message": "User registered successfully.",
+                    "status": "success",
+                    "data": serializer.data,
+                },
+                status=status.HTTP_201_CREATED,
+            )
+        except Exception as e:
+            logger.error(f"Unexpected error occurred during registration: {e}")
+            return Response(
+                {"message": "Registration failed.", "status": "error", "error": str(e)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+
+class LoginView(APIView):
+    """Authenticate a user and return JWT tokens."""
+
+    def post(self, request):
+        try:
+            serializer = LoginSerializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
+            user = CustomUser.objects.filter(email=serializer.validated_data['email']).first()
+            if user is not None:
+                user = authenticate(
+                    username=user.username,
+                    password=serializer.validated_data['password'],
+                )
+            if user is None:
+                return Response(
+                    {"message": "Invalid credentials.", "status": "error"},
+                    status=status.HTTP_401_UNAUTHORIZED,
+                )
+            refresh = RefreshToken.for_user(user)
+            logger.info("User logged in successfully.")
+            return Response(
+                {
+                    "message": "Login successful.",
+                    "status": "success",
+                    "data": {
+                        "access": str(refresh.access_token),
+                        "refresh": str(refresh),
+                    },
+                },
+                status=status.HTTP_200_OK,
+            )
+        except Exception as e:
+            logger.error(f"Unexpected error occurred during login: {e}")
+            return Response(
+                {"message": "Login failed.", "status": "error", "error": str(e)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )